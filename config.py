@@ -1,8 +1,31 @@
 """Configuration file handler for ES-CLI."""
+import copy
 import os
 import yaml
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, BinaryIO, Optional, Tuple
+
+# Use the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Parsed configs keyed by (absolute path, mtime_ns, size) so unchanged files
+# are not re-parsed when Config is constructed again
+_PARSED_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+
+# Elasticsearch keys to ignore (not valid for Elasticsearch client)
+# Common mistake: uncommented "Optional:" line
+_IGNORED_ES_KEYS = frozenset({'Optional', 'optional'})
+
+# Defaults for the 'query' section
+_DEFAULT_QUERY = MappingProxyType({
+    'default_size': 100,
+    'max_size': 10000,
+})
 
 
 class Config:
@@ -15,27 +38,48 @@ class Config:
             config_path: Path to config file. If None, looks for config.yaml in current dir or home.
         """
         if config_path is None:
-            # Try current directory first, then home directory
-            current_dir = Path.cwd() / "config.yaml"
-            home_dir = Path.home() / ".es-cli" / "config.yaml"
-            
-            if current_dir.exists():
-                config_path = str(current_dir)
-            elif home_dir.exists():
-                config_path = str(home_dir)
+            # Try current directory first, then home directory.
+            # Open directly instead of probing with exists() first.
+            candidates = [
+                Path.cwd() / "config.yaml",
+                Path.home() / ".es-cli" / "config.yaml",
+            ]
+            for candidate in candidates:
+                try:
+                    f = open(candidate, 'rb')
+                except FileNotFoundError:
+                    continue
+                config_path = str(candidate)
+                break
             else:
                 raise FileNotFoundError(
                     f"Config file not found. Please create config.yaml in current directory "
                     f"or ~/.es-cli/config.yaml. See config.yaml.example for template."
                 )
+        else:
+            f = open(config_path, 'rb')
         
         self.config_path = config_path
-        self._config = self._load_config()
+        with f:
+            self._config = self._load_config(f)
+        
+        query_config = self._config.get('query')
+        self._query_cfg = query_config if isinstance(query_config, dict) else {}
     
-    def _load_config(self) -> Dict[str, Any]:
-        """Load configuration from YAML file."""
-        with open(self.config_path, 'r') as f:
-            config = yaml.safe_load(f)
+    def _load_config(self, f: BinaryIO) -> Dict[str, Any]:
+        """Load configuration from an open YAML file.
+        
+        Args:
+            f: Binary file handle for self.config_path.
+        """
+        st = os.fstat(f.fileno())
+        cache_key = (os.path.abspath(self.config_path), st.st_mtime_ns, st.st_size)
+        cached = _PARSED_CACHE.get(cache_key)
+        if cached is not None:
+            # Hand out a copy so callers can't mutate the cached config
+            return copy.deepcopy(cached)
+        
+        config = yaml.load(f, Loader=_YamlLoader)
         
         # Ensure config is a dictionary
         if config is None:
@@ -47,29 +91,19 @@ class Config:
             )
         
         # Set defaults
-        defaults = {
-            'default_index': '*',
-            'query': {
-                'default_size': 100,
-                'max_size': 10000
-            }
-        }
-        
-        # Merge with defaults
-        for key, value in defaults.items():
-            if key not in config:
-                config[key] = value
-            elif isinstance(value, dict):
-                existing_value = config.get(key)
-                if isinstance(existing_value, dict):
-                    config[key] = {**value, **existing_value}
-                else:
-                    # Keep existing value if it's not a dict
-                    pass
+        config.setdefault('default_index', '*')
+        query_config = config.get('query')
+        if query_config is None:
+            config['query'] = dict(_DEFAULT_QUERY)
+        elif isinstance(query_config, dict):
+            for key, value in _DEFAULT_QUERY.items():
+                query_config.setdefault(key, value)
+        # Keep existing value if it's not a dict
         
-        return config
+        _PARSED_CACHE[cache_key] = config
+        return copy.deepcopy(config)
     
-    @property
+    @cached_property
     def elasticsearch_config(self) -> Dict[str, Any]:
         """Get Elasticsearch connection configuration."""
         es_config = self._config.get('elasticsearch', {})
@@ -79,38 +113,33 @@ class Config:
             raise ValueError(f"elasticsearch config must be a dictionary, got {type(es_config)}")
         
         # Filter out any None values, invalid keys, and comments
-        # Keys to ignore (not valid for Elasticsearch client)
-        ignored_keys = {'Optional', 'optional'}  # Common mistake: uncommented "Optional:" line
-        
         clean_config = {}
         for key, value in es_config.items():
-            # Skip None values, invalid keys, and ensure key is a string
-            if value is None or not isinstance(key, str):
-                continue
-            
-            # Skip ignored keys (like "Optional" from comments)
-            if key in ignored_keys:
+            # Skip None values, non-string keys and ignored keys (like "Optional" from comments)
+            if value is None or not isinstance(key, str) or key in _IGNORED_ES_KEYS:
                 continue
             
-            # Skip keys that start with comment-like patterns
-            if key.strip().startswith('#'):
+            # Skip keys that start with comment-like patterns; only strip when
+            # the key actually starts with whitespace
+            first = key[:1]
+            if first == '#' or (first.isspace() and key.lstrip()[:1] == '#'):
                 continue
             
             clean_config[key] = value
         
         return clean_config
     
-    @property
+    @cached_property
     def default_index(self) -> str:
         """Get default index pattern."""
         return self._config.get('default_index', '*')
     
-    @property
+    @cached_property
     def default_size(self) -> int:
         """Get default query result size."""
-        return self._config.get('query', {}).get('default_size', 100)
+        return self._query_cfg.get('default_size', 100)
     
-    @property
+    @cached_property
     def max_size(self) -> int:
         """Get maximum query result size."""
-        return self._config.get('query', {}).get('max_size', 10000)
+        return self._query_cfg.get('max_size', 10000)
@@ -1,62 +1,91 @@
 """Elasticsearch client wrapper with KQL and ESQL support."""
+import re
 from typing import Dict, Any, List, Optional
 from elasticsearch import Elasticsearch
-from elasticsearch.exceptions import RequestError, ConnectionError
+from elasticsearch.exceptions import (
+    ApiError, ConnectionError, NotFoundError, RequestError, TransportError
+)
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
-import urllib3
 import warnings
+from urllib.parse import urlsplit
+from time_range import es_timestamp
+from warning_filters import apply_warning_filters
+
+# orjson is optional; it decodes large ESQL responses considerably faster
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 # Suppress SSL warnings
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-warnings.filterwarnings('ignore', message='.*verify_certs=False.*')
-warnings.filterwarnings('ignore', message='.*TLS.*insecure.*')
+apply_warning_filters()
+
+# Config keys that are never passed to the Elasticsearch client
+_IGNORED_KEYS = frozenset({'use_ssl', 'Optional', 'optional'})
+
+# Config keys accepted by the Elasticsearch client (plus http_*/request_* prefixes)
+_VALID_KEYS = frozenset({
+    'hosts', 'host', 'cloud_id', 'api_key', 'basic_auth', 'bearer_auth',
+    'opaque_id', 'headers', 'connections_per_node', 'http_compress',
+    'verify_certs', 'ca_certs', 'client_cert', 'client_key', 'ssl_assert_hostname',
+    'ssl_assert_fingerprint', 'ssl_version', 'ssl_show_warn',
+    'max_retries', 'retry_on_status', 'retry_on_timeout',
+    'sniff_on_start', 'sniff_on_connection_fail', 'sniffer_timeout', 'sniff_timeout',
+    'min_delay_between_sniffing', 'timeout', 'max_timeout',
+})
+
+# Shared request templates for the common case; only ever read, never mutated
+_DEFAULT_SORT = ({"@timestamp": {"order": "desc"}},)
+_JSON_PARAMS = {"format": "json"}
+
+# Raw config keys needed for direct HTTP (ESQL) requests
+_HTTP_KEYS = frozenset({'hosts', 'basic_auth', 'verify_certs', 'use_ssl'})
+
+# FROM / WHERE keywords and pipes, used to splice a time filter into ESQL
+_ESQL_CLAUSE_RE = re.compile(r'(?P<from>\bFROM\b)|(?P<where>\bWHERE\b)|(?P<pipe>\|)', re.IGNORECASE)
 
 
 class ESClient:
     """Wrapper around Elasticsearch client with KQL and ESQL query support."""
     
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], test_connection: bool = False):
         """Initialize Elasticsearch client.
         
         Args:
             config: Elasticsearch configuration dictionary.
+            test_connection: Ping the cluster before returning. Off by default;
+                connection errors otherwise surface on the first query.
         """
-        # Store original config for direct HTTP requests
-        self._original_config = config.copy()
-        
         # Validate config
         if not isinstance(config, dict):
             raise ValueError(f"Config must be a dictionary, got {type(config)}")
         
-        # Clean config for Elasticsearch client
+        # Clean config for Elasticsearch client, keeping aside the few raw
+        # settings needed for direct ESQL requests
         clean_config = {}
-        ignored_keys = {'use_ssl', 'Optional', 'optional'}
-        
-        valid_keys = {
-            'hosts', 'host', 'cloud_id', 'api_key', 'basic_auth', 'bearer_auth',
-            'opaque_id', 'headers', 'connections_per_node', 'http_compress',
-            'verify_certs', 'ca_certs', 'client_cert', 'client_key', 'ssl_assert_hostname',
-            'ssl_assert_fingerprint', 'ssl_version', 'ssl_show_warn',
-            'max_retries', 'retry_on_status', 'retry_on_timeout',
-            'sniff_on_start', 'sniff_on_connection_fail', 'sniffer_timeout', 'sniff_timeout',
-            'min_delay_between_sniffing', 'timeout', 'max_timeout'
-        }
-        
+        http_config = {}
         for k, v in config.items():
-            if v is None or not isinstance(k, str) or k in ignored_keys:
+            if v is None or not isinstance(k, str):
                 continue
-            if k in valid_keys or k.startswith('http_') or k.startswith('request_'):
-                # Convert basic_auth from dict to tuple format expected by SDK
-                if k == 'basic_auth' and isinstance(v, dict):
-                    username = v.get('username', '')
-                    password = v.get('password', '')
-                    clean_config[k] = (username, password)
-                else:
-                    clean_config[k] = v
+            if k in _HTTP_KEYS:
+                http_config[k] = v
+            if k in _IGNORED_KEYS:
+                continue
+            if k in _VALID_KEYS or k.startswith(('http_', 'request_')):
+                clean_config[k] = v
+        
+        # Convert basic_auth from dict to tuple format expected by SDK
+        basic_auth = clean_config.get('basic_auth')
+        if isinstance(basic_auth, dict):
+            clean_config['basic_auth'] = (
+                basic_auth.get('username', ''),
+                basic_auth.get('password', ''),
+            )
         
         # Handle use_ssl
-        if config.get('use_ssl', False) and 'hosts' in clean_config:
+        if http_config.get('use_ssl', False) and 'hosts' in clean_config:
             hosts = clean_config['hosts']
             if isinstance(hosts, list):
                 clean_config['hosts'] = [
@@ -77,22 +106,38 @@ class ESClient:
                 f"Config keys provided: {list(config.keys())}"
             ) from e
         
-        # Skip connection test if there are SDK decode issues - we'll test on first query instead
-        try:
-            self._test_connection()
-        except Exception as e:
-            error_str = str(e)
-            if 'decode' in error_str.lower() or "'dict' object has no attribute 'decode'" in error_str:
-                # SDK has an internal issue, but client might still work
-                # Skip the test and continue - we'll catch errors on actual queries
-                import warnings
-                warnings.warn(
-                    f"Connection test skipped due to SDK issue: {e}. "
-                    "The client will still work for queries.",
-                    UserWarning
-                )
-            else:
-                raise
+        # Resolve ESQL endpoint, auth and SSL settings once
+        self._base_url = self._get_base_url(http_config)
+        self._esql_url = f"{self._base_url}/_query"
+        self._auth = self._get_auth(http_config)
+        self._verify = self._get_verify(http_config)
+        
+        # Pooled HTTP session for ESQL requests so keep-alive connections
+        # (and TLS sessions) are reused across queries
+        self._http = requests.Session()
+        self._http.auth = self._auth
+        self._http.verify = self._verify
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=8)
+        self._http.mount('http://', adapter)
+        self._http.mount('https://', adapter)
+        
+        if test_connection:
+            # Skip connection test if there are SDK decode issues - we'll test on first query instead
+            try:
+                self._test_connection()
+            except Exception as e:
+                error_str = str(e)
+                if 'decode' in error_str.lower() or "'dict' object has no attribute 'decode'" in error_str:
+                    # SDK has an internal issue, but client might still work
+                    # Skip the test and continue - we'll catch errors on actual queries
+                    import warnings
+                    warnings.warn(
+                        f"Connection test skipped due to SDK issue: {e}. "
+                        "The client will still work for queries.",
+                        UserWarning
+                    )
+                else:
+                    raise
     
     def _test_connection(self):
         """Test connection to Elasticsearch."""
@@ -119,19 +164,27 @@ class ESClient:
                 return
             raise ConnectionError(f"Failed to connect to Elasticsearch: {e}")
     
-    def _get_base_url(self) -> str:
+    @property
+    def host(self) -> str:
+        """Get the Elasticsearch host queries are sent to, without any credentials."""
+        netloc = urlsplit(self._base_url).netloc
+        return netloc.rpartition('@')[2] or self._base_url
+    
+    @staticmethod
+    def _get_base_url(http_config: Dict[str, Any]) -> str:
         """Get base URL from config."""
-        hosts = self._original_config.get('hosts', ['http://localhost:9200'])
+        hosts = http_config.get('hosts', ['http://localhost:9200'])
         if isinstance(hosts, list) and len(hosts) > 0:
             return hosts[0].rstrip('/')
         elif isinstance(hosts, str):
             return hosts.rstrip('/')
         return 'http://localhost:9200'
     
-    def _get_auth(self):
+    @staticmethod
+    def _get_auth(http_config: Dict[str, Any]):
         """Get authentication from config."""
-        if 'basic_auth' in self._original_config:
-            basic_auth = self._original_config['basic_auth']
+        if 'basic_auth' in http_config:
+            basic_auth = http_config['basic_auth']
             if isinstance(basic_auth, dict):
                 username = basic_auth.get('username', '')
                 password = basic_auth.get('password', '')
@@ -139,9 +192,10 @@ class ESClient:
                     return HTTPBasicAuth(username, password)
         return None
     
-    def _get_verify(self):
+    @staticmethod
+    def _get_verify(http_config: Dict[str, Any]):
         """Get SSL verification setting from config."""
-        verify = self._original_config.get('verify_certs', True)
+        verify = http_config.get('verify_certs', True)
         if verify is False:
             return False
         elif isinstance(verify, str):
@@ -173,39 +227,23 @@ class ESClient:
             Elasticsearch search response
         """
         try:
-            # Build query
-            query_clauses = []
-            
-            # Add time range filter if provided
+            # Build query: time range filter and/or user query, else match_all
+            has_query = bool(query.strip())
             if time_range:
                 start_time, end_time = time_range
-                time_filter = {
-                    "range": {
-                        time_field: {
-                            "gte": start_time.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z',
-                            "lte": end_time.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z'
+                gte = es_timestamp(start_time)
+                lte = es_timestamp(end_time)
+                time_filter = {"range": {time_field: {"gte": gte, "lte": lte}}}
+                if has_query:
+                    final_query = {
+                        "bool": {
+                            "must": [time_filter, {"query_string": {"query": query}}]
                         }
                     }
-                }
-                query_clauses.append(time_filter)
-            
-            # Add user query
-            if query.strip():
-                query_clauses.append({
-                    "query_string": {
-                        "query": query
-                    }
-                })
-            
-            # Build final query
-            if len(query_clauses) == 1:
-                final_query = query_clauses[0]
-            elif len(query_clauses) > 1:
-                final_query = {
-                    "bool": {
-                        "must": query_clauses
-                    }
-                }
+                else:
+                    final_query = time_filter
+            elif has_query:
+                final_query = {"query_string": {"query": query}}
             else:
                 final_query = {"match_all": {}}
             
@@ -217,8 +255,10 @@ class ESClient:
             
             if sort:
                 search_body["sort"] = sort
-            else:
+            elif time_field == "@timestamp":
                 # Default sort by time field descending
+                search_body["sort"] = list(_DEFAULT_SORT)
+            else:
                 search_body["sort"] = [{time_field: {"order": "desc"}}]
             
             # Use longer timeout for searches (5 minutes)
@@ -257,61 +297,62 @@ class ESClient:
             if time_range:
                 start_time, end_time = time_range
                 # Format times for ESQL (ISO 8601 format)
-                start_str = start_time.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z'
-                end_str = end_time.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z'
+                start_str = es_timestamp(start_time)
+                end_str = es_timestamp(end_time)
+                time_condition = f"{time_field} >= \"{start_str}\" AND {time_field} <= \"{end_str}\""
                 
-                # Check if query already has a WHERE clause
-                query_upper = query.upper()
-                if 'WHERE' in query_upper:
+                # Locate the first FROM, the first pipe after it and any WHERE
+                # in a single pass over the query
+                from_pos = where_pos = pipe_pos = None
+                for match in _ESQL_CLAUSE_RE.finditer(query):
+                    kind = match.lastgroup
+                    if kind == 'where':
+                        where_pos = match.start()
+                        break
+                    if kind == 'from':
+                        if from_pos is None:
+                            from_pos = match.start()
+                    elif from_pos is not None and pipe_pos is None:
+                        pipe_pos = match.start()
+                
+                if where_pos is not None:
                     # Add time filter to existing WHERE clause
-                    # Find WHERE position and add time condition
-                    where_pos = query_upper.find('WHERE')
                     after_where = query[where_pos + 5:].strip()
                     # Add time filter at the beginning of WHERE conditions
-                    time_filter = f"{time_field} >= \"{start_str}\" AND {time_field} <= \"{end_str}\" AND "
-                    query = query[:where_pos + 5] + " " + time_filter + after_where
-                else:
-                    # Add WHERE clause with time filter
-                    # Find the FROM clause and add WHERE after it
-                    from_pos = query_upper.find('FROM')
-                    if from_pos != -1:
-                        # Find where FROM clause ends (usually at | or end)
-                        pipe_pos = query.find('|', from_pos)
-                        if pipe_pos != -1:
-                            # Insert WHERE clause before the pipe
-                            query = query[:pipe_pos].strip() + f" | WHERE {time_field} >= \"{start_str}\" AND {time_field} <= \"{end_str}\" | " + query[pipe_pos + 1:].strip()
-                        else:
-                            # No pipe found, add WHERE at the end
-                            query = query.strip() + f" | WHERE {time_field} >= \"{start_str}\" AND {time_field} <= \"{end_str}\""
-            
-            # Build URL
-            base_url = self._get_base_url()
-            url = f"{base_url}/_query"
+                    query = query[:where_pos + 5] + " " + time_condition + " AND " + after_where
+                elif from_pos is not None:
+                    # Add WHERE clause with time filter after the FROM clause
+                    if pipe_pos is not None:
+                        # Insert WHERE clause before the pipe
+                        query = query[:pipe_pos].strip() + f" | WHERE {time_condition} | " + query[pipe_pos + 1:].strip()
+                    else:
+                        # No pipe found, add WHERE at the end
+                        query = query.strip() + f" | WHERE {time_condition}"
             
             # Prepare request
-            params = {"format": format} if format else {}
+            if format == "json":
+                params = _JSON_PARAMS
+            else:
+                params = {"format": format} if format else {}
             payload = {"query": query}
             
-            # Get auth and SSL settings
-            auth = self._get_auth()
-            verify = self._get_verify()
-            
-            # Make HTTP request directly using requests with extended timeout (10 minutes)
+            # Make HTTP request on the pooled session with extended timeout (10 minutes)
             # ESQL queries can take longer, especially on large datasets
-            response = requests.post(
-                url,
+            # verify is passed per request because requests lets REQUESTS_CA_BUNDLE
+            # override Session.verify otherwise
+            response = self._http.post(
+                self._esql_url,
                 json=payload,
-                auth=auth,
                 params=params,
                 timeout=600,  # 10 minutes for ESQL queries
-                verify=verify
+                verify=self._verify
             )
             
             # Raise for HTTP errors
             response.raise_for_status()
             
-            # Return JSON response - requests handles this correctly
-            return response.json()
+            # Decode the raw body bytes directly (orjson when available)
+            return _json_loads(response.content)
                 
         except requests.exceptions.HTTPError as e:
             # Handle HTTP errors
@@ -326,7 +367,7 @@ class ESClient:
                         "3) Making the query more specific, or 4) Using KQL instead."
                     )
                 try:
-                    error_data = e.response.json()
+                    error_data = _json_loads(e.response.content)
                     error_msg = error_data.get('error', {}).get('reason', str(e))
                 except:
                     error_msg = f"HTTP {status_code}: {str(e)}"
@@ -351,13 +392,17 @@ class ESClient:
             pattern: Index pattern (default: "*")
             
         Returns:
-            List of index names
+            List of index names (empty if nothing matches the pattern)
         """
         try:
             indices = self.client.indices.get_alias(index=pattern)
             return list(indices.keys())
-        except Exception:
+        except NotFoundError:
             return []
+        except (ApiError, TransportError) as e:
+            # Unlike a missing index, a failed request is raised for the caller
+            # to report (a printed warning would land on top of the UI)
+            raise RuntimeError(f"Failed to list indices: {e}") from e
     
     def get_index_info(self, index: str) -> Dict[str, Any]:
         """Get information about an index.
@@ -370,5 +415,5 @@ class ESClient:
         """
         try:
             return self.client.indices.get(index=index)
-        except Exception as e:
-            raise ValueError(f"Failed to get index info: {e}")
+        except (ApiError, TransportError) as e:
+            raise ValueError(f"Failed to get index info: {e}") from e
@@ -1,33 +1,25 @@
 #!/usr/bin/env python3
 """ES-CLI: A ncurses-based CLI tool for Elasticsearch."""
 import sys
-import urwid
-import warnings
-import urllib3
-from config import Config
-from es_client import ESClient
-from ui import MainWindow
+from warning_filters import apply_warning_filters, urwid_warnings_ignored
 
 # Suppress SSL warnings globally
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-warnings.filterwarnings('ignore', message='.*verify_certs=False.*')
-warnings.filterwarnings('ignore', message='.*TLS.*insecure.*')
-warnings.filterwarnings('ignore', category=urllib3.exceptions.InsecureRequestWarning)
-
-# Suppress urwid widget sizing warnings
-warnings.filterwarnings('ignore', message='.*ColumnsWarning.*')
-warnings.filterwarnings('ignore', message='.*Columns widget contents flags.*')
-warnings.filterwarnings('ignore', message='.*BOX WEIGHT.*')
-warnings.filterwarnings('ignore', message='.*Using fallback hardcoded.*')
-warnings.filterwarnings('ignore', category=UserWarning, module='urwid')
+apply_warning_filters()
 
 
 def main():
     """Main entry point."""
     try:
         # Load configuration
+        from config import Config
         config = Config()
         
+        # Import the Elasticsearch client and UI stacks only once the config
+        # has loaded, so config errors don't pay for them
+        import urwid
+        from es_client import ESClient
+        from ui import MainWindow
+        
         # Initialize Elasticsearch client
         es_client = ESClient(config.elasticsearch_config)
         
@@ -49,19 +41,23 @@ def main():
             if key == 'q':
                 raise urwid.ExitMainLoop()
             elif key == 'n':
-                # Next page
+                # Next page (ignored while a query is still running)
+                if main_window._search_in_progress:
+                    return
                 if main_window.current_from + main_window.current_size < main_window.results_table.total_hits:
                     main_window.current_from += main_window.current_size
                     query, query_type = main_window.query_input.get_query()
-                    if query:
-                        main_window._on_query_submit(query, query_type)
+                    if query.strip():
+                        main_window._on_query_submit(query.strip(), query_type, page_change=True)
             elif key == 'p':
-                # Previous page
+                # Previous page (ignored while a query is still running)
+                if main_window._search_in_progress:
+                    return
                 if main_window.current_from > 0:
                     main_window.current_from = max(0, main_window.current_from - main_window.current_size)
                     query, query_type = main_window.query_input.get_query()
-                    if query:
-                        main_window._on_query_submit(query, query_type)
+                    if query.strip():
+                        main_window._on_query_submit(query.strip(), query_type, page_change=True)
             elif key in ('right', 'l', 'left', 'h'):
                 # Horizontal scrolling - let the results table handle it
                 return None
@@ -72,8 +68,8 @@ def main():
             unhandled_input=handle_unhandled_input
         )
         
-        # Store loop reference in main_window for status updates
-        main_window._main_loop = loop
+        # Store loop reference in main_window for status updates and deferred redraws
+        main_window.set_main_loop(loop)
         
         # Set focus on query input after UI is rendered
         def set_initial_focus(loop, user_data):
@@ -85,9 +81,10 @@ def main():
         # Use alarm to set focus after the first render (use 0 to set immediately after first draw)
         loop.set_alarm_in(0, set_initial_focus)
         
-        # Run
+        # Run, keeping urwid's layout warnings off the screen
         try:
-            loop.run()
+            with urwid_warnings_ignored():
+                loop.run()
         except KeyboardInterrupt:
             # User pressed Ctrl+C, exit gracefully
             pass
@@ -1,8 +1,20 @@
 """Time range utilities for ES-CLI."""
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Tuple, Optional, Dict
 
 
+def es_timestamp(dt: datetime) -> str:
+    """Format a UTC datetime as an Elasticsearch ISO 8601 timestamp.
+    
+    Args:
+        dt: Naive datetime in UTC
+        
+    Returns:
+        Timestamp with millisecond precision, e.g. '2024-01-01T12:00:00.000Z'
+    """
+    return dt.isoformat(timespec='milliseconds') + 'Z'
+
+
 class TimeRange:
     """Handles time range selection and conversion."""
     
@@ -30,11 +42,12 @@ class TimeRange:
         Returns:
             Tuple of (start_time, end_time)
         """
-        if preset not in TimeRange.PRESETS:
-            preset = TimeRange.DEFAULT_PRESET
+        delta = TimeRange.PRESETS.get(preset)
+        if delta is None:
+            delta = TimeRange.PRESETS[TimeRange.DEFAULT_PRESET]
         
-        delta = TimeRange.PRESETS[preset]
-        end_time = datetime.utcnow()
+        # Naive UTC, as expected by es_timestamp()
+        end_time = datetime.now(timezone.utc).replace(tzinfo=None)
         start_time = end_time - delta
         
         return (start_time, end_time)
@@ -51,6 +64,6 @@ class TimeRange:
             Dict with 'gte' and 'lte' in ISO format
         """
         return {
-            'gte': start_time.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z',
-            'lte': end_time.strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z'
+            'gte': es_timestamp(start_time),
+            'lte': es_timestamp(end_time)
         }
@@ -1,16 +1,30 @@
 """NCurses UI components for ES-CLI."""
+import os
+import threading
 import urwid
+from collections import OrderedDict
+from concurrent.futures import Future
+from functools import partial
+from itertools import compress, zip_longest
 from typing import List, Dict, Any, Optional, Callable
 from datetime import datetime, timedelta
-import warnings
 from time_range import TimeRange
 
-# Suppress urwid widget sizing warnings
-warnings.filterwarnings('ignore', message='.*ColumnsWarning.*')
-warnings.filterwarnings('ignore', message='.*Columns widget contents flags.*')
-warnings.filterwarnings('ignore', message='.*BOX WEIGHT.*')
-warnings.filterwarnings('ignore', message='.*Using fallback hardcoded.*')
-warnings.filterwarnings('ignore', category=UserWarning, module='urwid')
+# Control characters would break a result row onto extra lines or shift the
+# columns after them, so they are shown as spaces
+_CONTROL_CHARS = dict.fromkeys((*range(32), 127), ' ')
+
+
+def _display_text(text: str) -> str:
+    """Replace control characters so the text stays on a single line."""
+    return text if text.isprintable() else text.translate(_CONTROL_CHARS)
+
+
+def _text_width(text: str) -> int:
+    """Get the number of screen columns the text takes (wide characters count twice)."""
+    if text.isascii():
+        return len(text)
+    return urwid.calc_width(text, 0, len(text))
 
 
 class TimeRangeSelector(urwid.WidgetWrap):
@@ -27,12 +41,14 @@ class TimeRangeSelector(urwid.WidgetWrap):
         
         # Create buttons for each preset
         self.buttons = []
+        self._btn_by_preset = {}
         for preset in TimeRange.PRESETS.keys():
             btn = urwid.Button(preset)
-            urwid.connect_signal(btn, 'click', self._on_button_click)
+            urwid.connect_signal(btn, 'click', self._on_button_click, user_args=[preset])
             if preset == self.current_preset:
                 btn.set_label(f"> {preset}")
             self.buttons.append(btn)
+            self._btn_by_preset[preset] = btn
         
         # Create list box
         self.list_walker = urwid.SimpleFocusListWalker(self.buttons)
@@ -49,9 +65,8 @@ class TimeRangeSelector(urwid.WidgetWrap):
         
         super().__init__(self._widget)
     
-    def _on_button_click(self, button):
+    def _on_button_click(self, preset, button):
         """Handle button click."""
-        preset = button.get_label().replace('> ', '')
         self.set_preset(preset)
     
     def set_preset(self, preset: str):
@@ -60,18 +75,14 @@ class TimeRangeSelector(urwid.WidgetWrap):
         Args:
             preset: Preset name
         """
-        if preset not in TimeRange.PRESETS:
+        if preset not in TimeRange.PRESETS or preset == self.current_preset:
             return
         
-        self.current_preset = preset
+        # Move the marker from the previous button to the new one
+        self._btn_by_preset[self.current_preset].set_label(self.current_preset)
+        self._btn_by_preset[preset].set_label(f"> {preset}")
         
-        # Update button labels
-        for btn in self.buttons:
-            label = btn.get_label().replace('> ', '')
-            if label == preset:
-                btn.set_label(f"> {preset}")
-            else:
-                btn.set_label(label)
+        self.current_preset = preset
         
         # Update info text
         self.info_text.set_text(f"Time Range: {self.current_preset}")
@@ -171,13 +182,105 @@ class QueryInput(urwid.WidgetWrap):
         return (self.query_edit.get_edit_text(), query_type)
 
 
+class ResultsWalker(urwid.ListWalker):
+    """List walker that builds result row widgets on demand.
+    
+    Position 0 is the header row and positions 1..N are the data rows. Row
+    widgets are only built when the ListBox asks for them and a bounded LRU
+    cache keeps recently used ones. When the view (horizontal scroll
+    position) changes, cached widgets are refreshed in place rather than
+    rebuilt.
+    """
+    
+    CACHE_SIZE = 256
+    
+    def __init__(self, build_row: Callable[[int, Optional[urwid.Widget]], urwid.Widget]):
+        """Initialize results walker.
+        
+        Args:
+            build_row: Callback(position, widget) returning the widget for a
+                position; widget is a cached one to update in place, or None
+        """
+        self._build_row = build_row
+        self._length = 0
+        self._view = None
+        self._cache = OrderedDict()
+        self.focus = 0
+    
+    def __len__(self):
+        return self._length
+    
+    def __getitem__(self, position):
+        if not isinstance(position, int) or not 0 <= position < self._length:
+            raise IndexError(position)
+        entry = self._cache.get(position)
+        if entry is None:
+            widget = self._build_row(position, None)
+            self._cache[position] = (self._view, widget)
+            if len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+            return widget
+        
+        view, widget = entry
+        if view != self._view:
+            widget = self._build_row(position, widget)
+            self._cache[position] = (self._view, widget)
+        self._cache.move_to_end(position)
+        return widget
+    
+    def next_position(self, position):
+        if position + 1 >= self._length:
+            raise IndexError(position)
+        return position + 1
+    
+    def prev_position(self, position):
+        if position <= 0:
+            raise IndexError(position)
+        return position - 1
+    
+    def positions(self, reverse=False):
+        if reverse:
+            return range(self._length - 1, -1, -1)
+        return range(self._length)
+    
+    def set_focus(self, position):
+        """Set the focused position."""
+        self.focus = position
+        self._modified()
+    
+    def update(self, length: int, view):
+        """Set the row count and the view key (e.g. horizontal scroll position).
+        
+        Cached widgets from another view are refreshed when next requested.
+        """
+        self._length = length
+        self._view = view
+        if self.focus >= length:
+            self.focus = max(0, length - 1)
+        self._modified()
+    
+    def clear(self):
+        """Drop all rows and cached widgets."""
+        self._length = 0
+        self._view = None
+        self._cache.clear()
+        self.focus = 0
+        self._modified()
+
+
 class ResultsTable(urwid.WidgetWrap):
     """Table widget for displaying search results."""
     
+    # Seconds to wait before redrawing after a horizontal scroll keypress
+    HSCROLL_DELAY = 0.02
+    
+    # Columns shown at once (kept low to allow wider columns and prevent truncation)
+    MAX_COLS_PER_SCREEN = 6
+    
     def __init__(self):
         """Initialize results table."""
-        # Create list walker for rows
-        self.list_walker = urwid.SimpleFocusListWalker([])
+        # Create list walker that builds row widgets on demand
+        self.list_walker = ResultsWalker(self._build_row)
         self.listbox = urwid.ListBox(self.list_walker)
         
         # Info bar
@@ -194,6 +297,27 @@ class ResultsTable(urwid.WidgetWrap):
         # Track horizontal scroll position
         self._hscroll_pos = 0
         
+        # Main loop used to coalesce horizontal scroll redraws (set by MainWindow)
+        self.main_loop = None
+        self._hscroll_alarm = None
+        
+        # Visible column window and widths used when building row widgets
+        self._visible_start = 0
+        self._visible_end = 0
+        self._col_widths = []
+        self._col_max_widths = []
+        
+        # Column-major copy of the rows, used by the per-column scans
+        self._cols = []
+        
+        # (scroll position, rows, headers) the current view was built for
+        self._last_render_key = None
+        
+        # Info text around the column scroll info, e.g. "Showing 1-100 of 250
+        # results" and the key hint; empty while no results are shown
+        self._info_base = ""
+        self._info_suffix = ""
+        
         # Initialize attributes after super() to avoid property issues with urwid.WidgetWrap
         # Use _rows for internal storage, accessed via property
         object.__setattr__(self, 'headers', [])
@@ -217,15 +341,13 @@ class ResultsTable(urwid.WidgetWrap):
     
     def _display_kql_results(self, response: Dict[str, Any]):
         """Display KQL search results."""
-        hits = response.get('hits', {}).get('hits', [])
-        total = response.get('hits', {}).get('total', {})
-        
-        if isinstance(total, dict):
-            self.total_hits = total.get('value', 0)
-        else:
-            self.total_hits = total
+        hits_obj = response.get('hits') or {}
+        hits = hits_obj.get('hits', ())
+        total = hits_obj.get('total', 0)
+        self.total_hits = total.get('value', 0) if isinstance(total, dict) else total
         
         if not hits:
+            self._info_base = ""
             self.info_text.set_text("No results found")
             self.list_walker.clear()
             return
@@ -243,8 +365,9 @@ class ResultsTable(urwid.WidgetWrap):
             
             object.__setattr__(self, 'headers', headers_list)
         
-        # Build rows - use object.__setattr__ to avoid property issues
-        object.__setattr__(self, '_rows', [])
+        # Build rows locally, then store once - use object.__setattr__ to avoid property issues
+        rows_list = []
+        source_headers = self.headers[2:]
         for hit in hits:
             source = hit.get('_source', {})
             row = []
@@ -253,30 +376,25 @@ class ResultsTable(urwid.WidgetWrap):
             row.append(str(hit.get('_id', '')))
             row.append(str(hit.get('_index', '')))
             
-            # Add source fields
-            for header in self.headers[2:]:
-                value = source.get(header, '')
-                # Format value
-                if isinstance(value, (dict, list)):
-                    value = str(value)
-                elif isinstance(value, bool):
-                    value = str(value)
-                elif isinstance(value, (int, float)):
-                    value = str(value)
-                else:
-                    value = str(value)
-                row.append(value)
+            # Add source fields - every value type is shown via str(),
+            # missing fields and nulls as empty cells
+            row.extend([
+                '' if value is None else str(value)
+                for value in map(source.get, source_headers)
+            ])
             
-            # Append to rows list using property setter
-            current_rows = getattr(self, '_rows', [])
-            current_rows.append(row)
-            object.__setattr__(self, '_rows', current_rows)
+            rows_list.append(row)
+        
+        object.__setattr__(self, '_rows', rows_list)
+        self._cols = list(zip_longest(*rows_list, fillvalue=''))
         
         # Filter out columns where all values are empty
         self._filter_empty_columns()
+        self._update_column_max_widths()
         
         # Reset horizontal scroll position after filtering
         self._hscroll_pos = 0
+        self.list_walker.clear()
         
         # Update display
         self._update_display()
@@ -284,15 +402,9 @@ class ResultsTable(urwid.WidgetWrap):
         # Update info
         start = self.from_ + 1
         end = min(self.from_ + len(hits), self.total_hits)
-        headers = getattr(self, 'headers', [])
-        scroll_info = ""
-        max_cols_per_screen = 6
-        if len(headers) > max_cols_per_screen:
-            scroll_info = f" | Columns {self._hscroll_pos + 1}-{min(self._hscroll_pos + max_cols_per_screen, len(headers))} of {len(headers)} (←/→ to scroll)"
-        self.info_text.set_text(
-            f"Showing {start}-{end} of {self.total_hits} results{scroll_info} | "
-            f"Press 'n' for next page, 'p' for previous, 'q' to quit"
-        )
+        self._info_base = f"Showing {start}-{end} of {self.total_hits} results"
+        self._info_suffix = " | Press 'n' for next page, 'p' for previous, 'q' to quit"
+        self._update_info_text()
     
     def _display_esql_results(self, response: Dict[str, Any]):
         """Display ESQL query results."""
@@ -300,6 +412,7 @@ class ResultsTable(urwid.WidgetWrap):
         values = response.get('values', [])
         
         if not columns or not values:
+            self._info_base = ""
             self.info_text.set_text("No results found")
             self.list_walker.clear()
             return
@@ -307,37 +420,28 @@ class ResultsTable(urwid.WidgetWrap):
         object.__setattr__(self, 'headers', [col.get('name', '') for col in columns])
         object.__setattr__(self, 'rows', [])
         
-        rows_list = []
-        for row_values in values:
-            row = []
-            for val in row_values:
-                if isinstance(val, (dict, list)):
-                    val = str(val)
-                else:
-                    val = str(val) if val is not None else ''
-                row.append(val)
-            rows_list.append(row)
+        rows_list = [
+            ['' if val is None else str(val) for val in row_values]
+            for row_values in values
+        ]
         
         object.__setattr__(self, '_rows', rows_list)
         object.__setattr__(self, 'total_hits', len(rows_list))
+        self._cols = list(zip_longest(*rows_list, fillvalue=''))
         
         # Filter out columns where all values are empty
         self._filter_empty_columns()
+        self._update_column_max_widths()
         
         # Reset horizontal scroll position after filtering
         self._hscroll_pos = 0
+        self.list_walker.clear()
         
         self._update_display()
         
-        headers = getattr(self, 'headers', [])
-        scroll_info = ""
-        max_cols_per_screen = 6
-        if len(headers) > max_cols_per_screen:
-            scroll_info = f" | Columns {self._hscroll_pos + 1}-{min(self._hscroll_pos + max_cols_per_screen, len(headers))} of {len(headers)} (←/→ to scroll)"
-        self.info_text.set_text(
-            f"Showing {len(rows_list)} results{scroll_info} | "
-            f"Press 'q' to quit"
-        )
+        self._info_base = f"Showing {len(rows_list)} results"
+        self._info_suffix = " | Press 'q' to quit"
+        self._update_info_text()
     
     def _filter_empty_columns(self):
         """Filter out columns where all values are empty."""
@@ -347,160 +451,187 @@ class ResultsTable(urwid.WidgetWrap):
         if not headers or not rows:
             return
         
-        # Find columns with all empty values
-        empty_col_indices = set()
-        for col_idx in range(len(headers)):
-            all_empty = True
-            for row in rows:
-                if col_idx < len(row):
-                    value = str(row[col_idx]).strip()
-                    if value:  # Non-empty value found
-                        all_empty = False
-                        break
-            if all_empty:
-                empty_col_indices.add(col_idx)
-        
-        # Remove empty columns (in reverse order to maintain indices)
-        # But keep at least one column if all are empty (to avoid breaking the display)
-        if empty_col_indices and len(empty_col_indices) < len(headers):
-            # Create new headers and rows without empty columns
-            new_headers = [h for i, h in enumerate(headers) if i not in empty_col_indices]
-            new_rows = []
-            for row in rows:
-                new_row = [val for i, val in enumerate(row) if i not in empty_col_indices]
-                new_rows.append(new_row)
-            
-            object.__setattr__(self, 'headers', new_headers)
-            object.__setattr__(self, '_rows', new_rows)
+        # Flag columns that have at least one non-blank value (cells are already
+        # strings). Each scan stops at the first such cell, and isspace avoids
+        # building a stripped copy of every cell
+        keep = [not all(map(str.isspace, filter(None, col))) for col in self._cols[:len(headers)]]
+        keep.extend([False] * (len(headers) - len(keep)))
+        
+        # Nothing to remove (the common case), or keep them all if every column
+        # is empty (to avoid breaking the display)
+        if all(keep) or not any(keep):
+            return
+        
+        new_headers = list(compress(headers, keep))
+        new_rows = [list(compress(row, keep)) for row in rows]
+        
+        object.__setattr__(self, 'headers', new_headers)
+        object.__setattr__(self, '_rows', new_rows)
+        self._cols = list(compress(self._cols, keep))
     
-    def _calculate_column_widths(self, headers, rows, visible_start, visible_end):
+    def _update_column_max_widths(self):
+        """Cache the widest cell (in screen columns) of every column for the current rows."""
+        headers = getattr(self, 'headers', [])
+        # Cells are already strings, so no str() is needed here; plain ASCII
+        # columns (the common case) can use len() directly
+        widths = [
+            max(map(len, col), default=0) if all(map(str.isascii, col))
+            else max((_text_width(_display_text(cell)) for cell in col), default=0)
+            for col in self._cols[:len(headers)]
+        ]
+        widths.extend([0] * (len(headers) - len(widths)))
+        self._col_max_widths = widths
+    
+    def _calculate_column_widths(self, headers, visible_start, visible_end):
         """Calculate optimal column widths based on content."""
-        col_widths = []
         min_width = 15
         max_width = 100  # Increased to handle longer URLs and domain names
         
-        for col_idx in range(visible_start, visible_end):
-            if col_idx >= len(headers):
-                break
-            
-            # Start with header width
-            max_content_width = len(str(headers[col_idx]))
-            
-            # Check all rows for this column
-            for row in rows:
-                if col_idx < len(row):
-                    content_len = len(str(row[col_idx]))
-                    max_content_width = max(max_content_width, content_len)
-            
-            # Add padding (2 spaces on each side + 1 for divider)
-            width = max_content_width + 3
-            # Clamp between min and max
-            width = max(min_width, min(width, max_width))
-            col_widths.append(width)
-        
-        return col_widths
+        # Start with header width, widen to the longest cell, add padding
+        # (2 spaces on each side + 1 for divider) and clamp between min and max
+        return [
+            max(min_width, min(max(_text_width(_display_text(str(headers[col_idx]))), content_width) + 3, max_width))
+            for col_idx, content_width in enumerate(
+                self._col_max_widths[visible_start:visible_end], visible_start
+            )
+        ]
     
     def _update_display(self):
         """Update the listbox with current rows."""
-        self.list_walker.clear()
-        
         # Get rows safely
         rows = getattr(self, '_rows', [])
         headers = getattr(self, 'headers', [])
         
         if not headers or not rows:
+            self.list_walker.clear()
             return
         
-        # Calculate how many columns can fit (we'll use available width later)
-        # For now, show columns starting from _hscroll_pos
-        visible_start = self._hscroll_pos
-        max_cols_per_screen = 6  # Reduced further to allow wider columns and prevent truncation
-        
-        # Determine visible columns
-        visible_end = min(visible_start + max_cols_per_screen, len(headers))
-        visible_headers = headers[visible_start:visible_end]
+        self._update_visible_columns()
         
-        # Calculate optimal column widths
-        col_widths = self._calculate_column_widths(headers, rows, visible_start, visible_end)
+        # Set focus to first data row
+        if len(self.list_walker) > 1:
+            self.listbox.set_focus(1)
+    
+    def _update_visible_columns(self):
+        """Recompute the visible column window for the current scroll position.
         
-        # Build header row
-        header_cells = []
-        # Add left scroll indicator
-        if visible_start > 0:
-            header_cells.append(('fixed', 3, urwid.Text("◄", align='center')))
+        Row widgets are built lazily by the walker, so this only touches the
+        column widths and the walker's view; row focus is left alone.
+        """
+        rows = getattr(self, '_rows', [])
+        headers = getattr(self, 'headers', [])
         
-        for i, h in enumerate(visible_headers):
-            col_width = col_widths[i] if i < len(col_widths) else 30
-            # Don't truncate header names - use full width
-            header_text = f" {h:<{col_width-2}} "
-            header_cells.append(('fixed', col_width, urwid.Text(header_text, align='left')))
+        # Determine visible columns, starting from _hscroll_pos
+        _, visible_start, visible_end = self._scroll_state()
         
-        # Add right scroll indicator
-        if visible_end < len(headers):
-            header_cells.append(('fixed', 3, urwid.Text("►", align='center')))
+        # Calculate optimal column widths
+        self._visible_start = visible_start
+        self._visible_end = visible_end
+        self._col_widths = self._calculate_column_widths(headers, visible_start, visible_end)
         
-        header_row = urwid.AttrMap(
-            urwid.Columns(header_cells, dividechars=1),
-            'header'
-        )
-        self.list_walker.append(header_row)
+        # Header plus data rows; widgets for this view are built on demand
+        self.list_walker.update(len(rows) + 1, visible_start)
+        self._last_render_key = (visible_start, id(rows), id(headers))
+    
+    def _row_text(self, position: int) -> str:
+        """Get the text of a walker position (0 is the header row).
         
-        # Add data rows
-        for i, row in enumerate(rows):
-            cells = []
-            
-            # Add left scroll indicator (spacer)
+        Cells are padded to their column width (in screen columns) and
+        separated by a single space, so the columns line up in one line.
+        """
+        headers = self.headers
+        visible_start = self._visible_start
+        visible_end = self._visible_end
+        col_widths = self._col_widths
+        cells = []
+        
+        if position == 0:
+            # Add left scroll indicator
             if visible_start > 0:
-                cells.append(('fixed', 3, urwid.Text(" ", align='center')))
+                cells.append(" ◄ ")
             
-            # Add visible columns
-            for j in range(visible_start, min(visible_end, len(row))):
-                col_idx = j - visible_start
-                col_width = col_widths[col_idx] if col_idx < len(col_widths) else 30
-                cell_str = str(row[j])
-                
-                # Only truncate if absolutely necessary (very long content)
-                if len(cell_str) > col_width - 3:
-                    # Truncate but show more content
-                    cell_str = cell_str[:col_width-6] + "..."
-                cell_text = f" {cell_str:<{col_width-2}} "
-                cells.append(('fixed', col_width, urwid.Text(cell_text, align='left')))
+            for i, h in enumerate(headers[visible_start:visible_end]):
+                col_width = col_widths[i] if i < len(col_widths) else 30
+                # Don't truncate header names - use full width (clipped to the
+                # column so the cells below stay aligned)
+                h = _display_text(h)
+                h_width = _text_width(h)
+                if h_width > col_width - 2:
+                    end, h_width = urwid.calc_text_pos(h, 0, len(h), col_width - 2)
+                    h = h[:end]
+                cells.append(' ' + h + ' ' * (col_width - 2 - h_width) + ' ')
             
-            # Add right scroll indicator (spacer)
+            # Add right scroll indicator
             if visible_end < len(headers):
-                cells.append(('fixed', 3, urwid.Text(" ", align='center')))
+                cells.append(" ► ")
+            return ' '.join(cells)
+        
+        row = self._rows[position - 1]
+        
+        # Add left scroll indicator (spacer)
+        if visible_start > 0:
+            cells.append("   ")
+        
+        # Add visible columns (cells are already strings)
+        for j in range(visible_start, min(visible_end, len(row))):
+            col_idx = j - visible_start
+            col_width = col_widths[col_idx] if col_idx < len(col_widths) else 30
+            cell_str = _display_text(row[j])
+            cell_width = _text_width(cell_str)
             
-            row_widget = urwid.AttrMap(
-                urwid.Columns(cells, dividechars=1),
-                'row',
-                'selected'
-            )
-            self.list_walker.append(row_widget)
+            # Only truncate if absolutely necessary (very long content)
+            if cell_width > col_width - 3:
+                # Truncate but show more content
+                end, cell_width = urwid.calc_text_pos(cell_str, 0, len(cell_str), col_width - 6)
+                cell_str = cell_str[:end] + "..."
+                cell_width += 3
+            cells.append(' ' + cell_str + ' ' * (col_width - 2 - cell_width) + ' ')
+        
+        # Add right scroll indicator (spacer)
+        if visible_end < len(headers):
+            cells.append("   ")
+        return ' '.join(cells)
+    
+    def _build_row(self, position: int, widget: Optional[urwid.Widget] = None) -> urwid.Widget:
+        """Build the widget for a walker position, or refresh an existing one.
         
-        # Set focus to first data row
-        if len(self.list_walker) > 1:
-            self.listbox.set_focus(1)
+        Args:
+            position: Walker position (0 is the header row)
+            widget: Previously built widget to update in place, if any
+        """
+        row_text = self._row_text(position)
+        
+        if widget is None:
+            text_widget = urwid.Text(row_text, wrap='clip')
+            if position == 0:
+                return urwid.AttrMap(text_widget, 'header')
+            return urwid.AttrMap(text_widget, 'row', 'selected')
+        
+        widget.original_widget.set_text(row_text)
+        return widget
+    
+    def _scroll_state(self) -> tuple[int, int, int]:
+        """Get (number of headers, first visible column, end of visible columns)."""
+        n_headers = len(getattr(self, 'headers', []))
+        visible_start = self._hscroll_pos
+        visible_end = visible_start + self.MAX_COLS_PER_SCREEN
+        if visible_end > n_headers:
+            visible_end = n_headers
+        return n_headers, visible_start, visible_end
+    
+    def _build_scroll_info(self) -> str:
+        """Build the column scroll part of the info text (empty if all columns fit)."""
+        n_headers, visible_start, visible_end = self._scroll_state()
+        if n_headers <= self.MAX_COLS_PER_SCREEN:
+            return ""
+        return f" | Columns {visible_start + 1}-{visible_end} of {n_headers} (←/→ to scroll)"
     
     def _update_info_text(self):
         """Update info text with current scroll position."""
-        headers = getattr(self, 'headers', [])
-        scroll_info = ""
-        max_cols_per_screen = 6
-        if len(headers) > max_cols_per_screen:
-            scroll_info = f" | Columns {self._hscroll_pos + 1}-{min(self._hscroll_pos + max_cols_per_screen, len(headers))} of {len(headers)} (←/→ to scroll)"
-        
-        # Try to preserve existing info text content
-        current_text = self.info_text.text
-        # Extract the base message (before scroll info)
-        if "Showing" in current_text:
-            # For KQL results
-            if "of" in current_text and "results" in current_text:
-                parts = current_text.split(" | ")
-                base_msg = parts[0] if parts else current_text
-                self.info_text.set_text(f"{base_msg}{scroll_info} | Press 'n' for next page, 'p' for previous, 'q' to quit")
-            else:
-                # For ESQL results
-                self.info_text.set_text(f"{current_text.split(' | ')[0]}{scroll_info} | Press 'q' to quit")
+        # Leave "No results found" (or the initial text) alone
+        if not self._info_base:
+            return
+        self.info_text.set_text(f"{self._info_base}{self._build_scroll_info()}{self._info_suffix}")
     
     def keypress(self, size, key):
         """Handle keypress events."""
@@ -514,23 +645,47 @@ class ResultsTable(urwid.WidgetWrap):
             return key
         elif key == 'right' or key == 'l':
             # Scroll right
-            headers = getattr(self, 'headers', [])
-            max_cols_per_screen = 6
-            max_scroll = max(0, len(headers) - max_cols_per_screen)
+            n_headers = len(getattr(self, 'headers', []))
+            max_scroll = max(0, n_headers - self.MAX_COLS_PER_SCREEN)
             if self._hscroll_pos < max_scroll:
                 self._hscroll_pos += 1
-                self._update_display()
-                self._update_info_text()
+                self._schedule_hscroll()
             return None
         elif key == 'left' or key == 'h':
             # Scroll left
             if self._hscroll_pos > 0:
                 self._hscroll_pos -= 1
-                self._update_display()
-                self._update_info_text()
+                self._schedule_hscroll()
             return None
         return super().keypress(size, key)
     
+    def _schedule_hscroll(self):
+        """Redraw for a horizontal scroll, coalescing bursts of key repeats.
+        
+        With a main loop available the redraw is deferred by HSCROLL_DELAY so
+        a held arrow key results in one redraw rather than one per keypress.
+        """
+        if self.main_loop is None:
+            self._flush_hscroll()
+        elif self._hscroll_alarm is None:
+            self._hscroll_alarm = self.main_loop.set_alarm_in(
+                self.HSCROLL_DELAY, self._on_hscroll_alarm
+            )
+    
+    def _on_hscroll_alarm(self, loop, user_data=None):
+        """Handle the deferred horizontal scroll redraw."""
+        self._hscroll_alarm = None
+        self._flush_hscroll()
+    
+    def _flush_hscroll(self):
+        """Apply the current horizontal scroll position to the display."""
+        # Nothing moved (e.g. a right/left pair coalesced into one redraw)
+        render_key = (self._hscroll_pos, id(self._rows), id(self.headers))
+        if render_key == self._last_render_key:
+            return
+        self._update_visible_columns()
+        self._update_info_text()
+    
     def get_current_row(self) -> int:
         """Get currently focused row index."""
         focus = self.listbox.get_focus()
@@ -552,6 +707,13 @@ class ResultsTable(urwid.WidgetWrap):
 class MainWindow(urwid.WidgetWrap):
     """Main application window."""
     
+    # Status bar spinner shown while a query runs in the background
+    SPINNER_FRAMES = "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
+    SPINNER_INTERVAL = 0.1
+    
+    # Number of query responses kept for paging back and forth
+    RESPONSE_CACHE_SIZE = 32
+    
     def __init__(self, es_client, config):
         """Initialize main window.
         
@@ -575,7 +737,7 @@ class MainWindow(urwid.WidgetWrap):
         self.status_bar_text = urwid.Text(
             f"Index: {self.current_index} | "
             f"Time Range: {TimeRange.DEFAULT_PRESET} | "
-            f"Connected to Elasticsearch",
+            f"Elasticsearch: {self.es_client.host}",
             align='left'
         )
         self.status_bar = urwid.AttrMap(self.status_bar_text, 'status')
@@ -602,6 +764,21 @@ class MainWindow(urwid.WidgetWrap):
         # Store reference to query_edit for focus management
         self._query_edit_widget = self.query_input.query_edit
         
+        # Main loop, set once it has been created
+        self._main_loop = None
+        
+        # Background query state; results come back through a main loop pipe
+        self._result_pipe = None
+        self._pending_future = None
+        self._pending_query = None
+        self._search_in_progress = False
+        self._search_cancelled = False
+        self._spinner_idx = 0
+        self._spinner_handle = None
+        
+        # Recently seen pages of the current query, most recent last
+        self._response_cache = OrderedDict()
+        
         # Set up palette
         self.palette = [
             ('header', 'black', 'light gray', 'standout'),
@@ -611,6 +788,17 @@ class MainWindow(urwid.WidgetWrap):
             ('error', 'white', 'dark red'),
         ]
     
+    def set_main_loop(self, loop: urwid.MainLoop):
+        """Attach the main loop used for deferred redraws.
+        
+        Args:
+            loop: The application's urwid MainLoop
+        """
+        self._main_loop = loop
+        self.results_table.main_loop = loop
+        if self._result_pipe is None:
+            self._result_pipe = loop.watch_pipe(self._on_search_done)
+    
     def focus_query_input(self):
         """Set focus on the query input field."""
         try:
@@ -648,56 +836,140 @@ class MainWindow(urwid.WidgetWrap):
             except Exception:
                 pass
     
-    def _on_query_submit(self, query: str, query_type: str):
+    def _on_query_submit(self, query: str, query_type: str, page_change: bool = False):
         """Handle query submission.
         
+        The query runs on a background thread when a main loop is attached,
+        so the UI keeps redrawing; results are shown by _on_search_done.
+        
         Args:
             query: Query text
             query_type: Query type (KQL or ESQL)
+            page_change: True when re-running the current query for another
+                page; keeps current_from and may answer from the response cache
         """
-        # Reset pagination for new queries
-        self.current_from = 0
+        # Only one query at a time
+        if self._search_in_progress:
+            return
+        
+        if not page_change:
+            # Reset pagination and cached pages for new queries
+            self.current_from = 0
+            self._response_cache.clear()
+        
+        time_range_str = self.time_range_selector.current_preset
+        cache_key = (
+            query, query_type, self.current_index,
+            self.current_from, self.current_size, time_range_str,
+        )
+        self._pending_query = (query_type, time_range_str, cache_key)
+        
+        cached = self._response_cache.get(cache_key) if page_change else None
+        if cached is not None:
+            # Page already seen for this query - no need to ask Elasticsearch again
+            self._response_cache.move_to_end(cache_key)
+            self._finish_query(lambda: cached)
+            return
         
         # Show search in progress - update status bar immediately
         self.status_bar_text.set_text(f"⏳ Executing {query_type} query... Please wait (this may take a while)")
         self.status_bar.set_attr_map({None: 'status'})
         
-        # Note: UI will freeze during search, but status message is set
-        # The status bar will update when search completes
-        
         self._search_in_progress = True
         self._search_cancelled = False
         
+        # Get time range for both query types
+        start_time, end_time = self.time_range_selector.get_time_range()
+        
+        if query_type == "ESQL":
+            # ESQL queries now also get time range filtering
+            run_query = partial(
+                self.es_client.query_esql,
+                query,
+                time_range=(start_time, end_time)
+            )
+        else:
+            run_query = partial(
+                self.es_client.search_kql,
+                query,
+                index=self.current_index,
+                size=self.current_size,
+                from_=self.current_from,
+                time_range=(start_time, end_time)
+            )
+        
+        if self._result_pipe is None:
+            # No main loop to report back to - run synchronously
+            self._finish_query(run_query)
+            return
+        
+        future = Future()
+        self._pending_future = future
+        
+        def worker():
+            try:
+                future.set_result(run_query())
+            except Exception as e:
+                future.set_exception(e)
+            # Wake up the main loop, which calls _on_search_done
+            os.write(self._result_pipe, b'x')
+        
+        # Daemon thread so quitting doesn't wait for a long-running query
+        threading.Thread(target=worker, daemon=True).start()
+        
+        # Animate the status bar until the result comes back
+        self._spinner_idx = 0
+        self._spinner_handle = self._main_loop.set_alarm_in(
+            self.SPINNER_INTERVAL, self._tick_spinner
+        )
+    
+    def _tick_spinner(self, loop, user_data=None):
+        """Advance the status bar spinner while a query is running."""
+        if not self._search_in_progress:
+            self._spinner_handle = None
+            return
+        query_type = self._pending_query[0]
+        frame = self.SPINNER_FRAMES[self._spinner_idx % len(self.SPINNER_FRAMES)]
+        self._spinner_idx += 1
+        self.status_bar_text.set_text(f"{frame} Executing {query_type} query... Please wait (this may take a while)")
+        self._spinner_handle = loop.set_alarm_in(self.SPINNER_INTERVAL, self._tick_spinner)
+    
+    def _on_search_done(self, data: bytes) -> bool:
+        """Show the result of a background query (main loop pipe callback)."""
+        future = self._pending_future
+        if future is not None and future.done():
+            self._pending_future = None
+            if self._spinner_handle is not None:
+                self._main_loop.remove_alarm(self._spinner_handle)
+                self._spinner_handle = None
+            self._finish_query(future.result)
+        # Keep the pipe open for later queries
+        return True
+    
+    def _finish_query(self, get_response: Callable[[], Dict[str, Any]]):
+        """Display a query response and update the status bar.
+        
+        Args:
+            get_response: Returns the query response or raises its error
+        """
+        query_type, time_range_str, cache_key = self._pending_query
         try:
-            # Get time range for both query types
-            start_time, end_time = self.time_range_selector.get_time_range()
+            response = get_response()
+            self._search_in_progress = False
             
-            # Execute query (this will block, but status is already shown)
+            # Remember the page, evicting the least recently used one
+            self._response_cache[cache_key] = response
+            self._response_cache.move_to_end(cache_key)
+            if len(self._response_cache) > self.RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+            
+            self.results_table.from_ = cache_key[3]
             if query_type == "ESQL":
-                # ESQL queries now also get time range filtering
-                response = self.es_client.query_esql(
-                    query,
-                    time_range=(start_time, end_time)
-                )
-                self._search_in_progress = False
                 self.results_table.display_results(response, query_type="ESQL")
                 hits_count = getattr(self.results_table, 'total_hits', 0)
-                time_range_str = self.time_range_selector.current_preset
                 status_msg = f"✓ ESQL query executed successfully | Time Range: {time_range_str} | Results: {hits_count}"
             else:
-                # Get time range
-                start_time, end_time = self.time_range_selector.get_time_range()
-                
-                response = self.es_client.search_kql(
-                    query,
-                    index=self.current_index,
-                    size=self.current_size,
-                    from_=self.current_from,
-                    time_range=(start_time, end_time)
-                )
-                self._search_in_progress = False
                 self.results_table.display_results(response, query_type="KQL")
-                time_range_str = self.time_range_selector.current_preset
                 hits_count = getattr(self.results_table, 'total_hits', 0)
                 status_msg = (
                     f"✓ KQL query executed successfully | "
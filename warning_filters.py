@@ -0,0 +1,35 @@
+"""Warning filters for ES-CLI."""
+import warnings
+from contextlib import contextmanager
+import urllib3
+
+_applied = False
+
+
+def apply_warning_filters():
+    """Install the process-wide SSL warning filters.
+
+    Safe to call from every module that needs them; the filters are only
+    registered once so the global filter list doesn't collect duplicates.
+    """
+    global _applied
+    if _applied:
+        return
+    _applied = True
+
+    # Suppress SSL warnings
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    warnings.filterwarnings('ignore', message='.*verify_certs=False.*')
+    warnings.filterwarnings('ignore', message='.*TLS.*insecure.*')
+
+
+@contextmanager
+def urwid_warnings_ignored():
+    """Ignore warnings raised from urwid (e.g. Columns sizing) inside the block.
+
+    urwid reports these while laying out widgets, so they would be printed
+    over the terminal UI; the filter is removed again when the block exits.
+    """
+    with warnings.catch_warnings():
+        warnings.filterwarnings('ignore', module='urwid')
+        yield